@@ -1,17 +1,79 @@
 import asyncio
-import json
+import hashlib
 import os
+import re
+import time
+from collections import defaultdict, deque, OrderedDict
 import httpx
+import orjson
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 import logging
-from typing import Optional, Dict, Any, List
-import base64
+from typing import AsyncIterator, Final, Optional, Dict, Any, List
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+async def _warm_backends(app: FastAPI):
+    """Prime connections to each inference backend before the first user.
+
+    A throwaway GET per backend performs the TCP/TLS handshake and ALPN
+    HTTP/2 upgrade up front, leaving warm keepalive connections in the pool.
+    """
+    http_client = app.state.http_client
+
+    async def warm(url: str):
+        try:
+            await http_client.get(url, timeout=5.0)
+        except Exception as e:
+            logger.warning(f"Backend warmup failed for {url}: {e}")
+
+    await asyncio.gather(
+        warm(f"{LLM_API_URL}/models"),
+        warm(f"{STT_API_URL}/models"),
+        warm(TTS_API_URL.rsplit("/v1", 1)[0] + "/health"),
+    )
+
+    # Pre-synthesize the fixed fallback lines so error paths are served
+    # straight from the TTS cache with zero synthesis latency
+    seeder = VoiceAssistant(http_client, app.state.stt_scheduler)
+    await asyncio.gather(
+        seeder.text_to_speech(FALLBACK_NO_RESPONSE),
+        seeder.text_to_speech(FALLBACK_LLM_ERROR),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create one shared HTTP client for the process lifetime.
+
+    Connection pooling and keepalive mean new WebSocket connections reuse
+    warm TCP/TLS connections to the LLM/STT/TTS backends instead of paying
+    handshake cost per user. HTTP/2 multiplexes the concurrent STT/LLM/TTS
+    calls of a turn over a single connection per backend.
+    """
+    app.state.http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=60
+        ),
+        http2=True
+    )
+    app.state.stt_scheduler = SttScheduler()
+    app.state.stt_scheduler.start()
+    asyncio.create_task(_warm_backends(app))
+    try:
+        yield
+    finally:
+        app.state.stt_scheduler.stop()
+        await app.state.http_client.aclose()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS middleware for frontend
 app.add_middleware(
@@ -49,43 +111,236 @@ TOOLS = [
     }
 ]
 
+# Prompt prefix, used verbatim on every LLM call. Both constants are
+# computed once at import so the leading tokens are byte-identical across
+# calls and turns -- that is what lets the backend's prefix cache (vLLM
+# --enable-prefix-caching) skip re-prefilling the shared ~500 tokens of
+# tool schema plus persona. Anything mutable goes after these messages.
+TOOLS_SYSTEM_MSG: Final[str] = (
+    "You have access to the following tools (also registered with the API):\n"
+    + orjson.dumps(TOOLS).decode()
+)
+SYSTEM_MSG: Final[str] = "You are a helpful voice assistant. Keep responses concise and natural for voice output. When the user asks about weather, use the get_weather tool to provide accurate current information."
+
+# Sentence boundary for flushing streamed LLM tokens to TTS
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Upper bound on buffered upload audio (~10 minutes of Opus speech); a
+# misbehaving client must not be able to grow the buffer without limit
+MAX_AUDIO_BYTES = 10 * 1024 * 1024
+
+# Minimum spacing between audio_end messages on one connection
+MIN_AUDIO_END_INTERVAL = 1.0  # seconds
+
+# Speculative STT: minimum buffered audio before a speech_pause hint from
+# the client's VAD may trigger speculative transcription of the prefix
+SPECULATIVE_STT_MIN_BYTES = 32 * 1024
+
+LLM_MODEL = "Qwen/Qwen2.5-7B-Instruct-GPTQ-Int4"
+
+# Multipart body for STT requests, preassembled around a fixed boundary.
+# Every field except the audio bytes is constant, so the form sections are
+# encoded once at import and each request is a single concatenation instead
+# of a run through httpx's multipart encoder (which would also make an
+# extra copy of the audio payload).
+_STT_BOUNDARY = "voice-assistant-stt"
+
+# VAD parameters for optimal speech detection, serialized once at import
+VAD_PARAMETERS_JSON: Final[str] = orjson.dumps({
+    'threshold': 0.5,                 # Speech probability threshold
+    'min_speech_duration_ms': 250,    # Minimum speech duration
+    'min_silence_duration_ms': 500,   # Silence duration to split segments
+    'speech_pad_ms': 200,             # Padding around speech segments
+}).decode()
+
+
+def _multipart_field(name: str, value: str) -> bytes:
+    return (
+        f"--{_STT_BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+        f"{value}\r\n"
+    ).encode()
+
+
+_STT_FORM_FIELDS = b"".join([
+    _multipart_field('model', 'Systran/faster-distil-whisper-small.en'),
+    _multipart_field('response_format', 'json'),
+    _multipart_field('language', 'en'),  # English-only model; skip language detection
+    _multipart_field('vad_filter', 'true'),  # Enable Voice Activity Detection
+    _multipart_field('vad_parameters', VAD_PARAMETERS_JSON),
+])
+_STT_FILE_HEADER = (
+    f"--{_STT_BOUNDARY}\r\n"
+    'Content-Disposition: form-data; name="file"; filename="audio.ogg"\r\n'
+    "Content-Type: audio/ogg\r\n\r\n"
+).encode()
+_STT_TRAILER = f"\r\n--{_STT_BOUNDARY}--\r\n".encode()
+_STT_CONTENT_TYPE = f"multipart/form-data; boundary={_STT_BOUNDARY}"
+
+# Static portion of the chat-completion payload, serialized once at import.
+# Per turn only `messages` is serialized and spliced onto this prefix,
+# instead of re-encoding ~1 KB of tool schema and settings on every call.
+_CHAT_PAYLOAD_PREFIX = orjson.dumps({
+    "model": LLM_MODEL,
+    "tools": TOOLS,
+    "tool_choice": "auto",
+    "temperature": 0.7,
+    "max_tokens": 150,
+    "stream": True
+})[:-1]  # strip the closing brace
+
+
+def _chat_payload_bytes(messages: List[Dict[str, Any]]) -> bytes:
+    """Serialize a chat-completion request body around the static prefix"""
+    return _CHAT_PAYLOAD_PREFIX + b',"messages":' + orjson.dumps(messages) + b"}"
+
+# Fixed fallback lines spoken on empty or failed LLM turns
+FALLBACK_NO_RESPONSE = "I'm not sure how to respond to that."
+FALLBACK_LLM_ERROR = "I'm having trouble processing your request. Please try again."
+
+# TTS voice settings (voice options: af_sky, af_bella, af_nicole, am_adam, am_michael)
+TTS_VOICE = "af_sky"
+TTS_SPEED = 1.0
+
+# LRU cache of synthesized MP3 bytes. Assistant phrasing repeats often -- the
+# fixed fallback lines especially -- and cache hits skip Kokoro entirely.
+# Module-level so all connections share it and startup can pre-seed it.
+_TTS_CACHE_MAX = 64
+_tts_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+
+def _tts_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(
+        f"{TTS_VOICE}|{TTS_SPEED}|{text}".encode(),
+        digest_size=16
+    ).digest()
+
+
+# Weather changes slowly, and users ask about the same city repeatedly;
+# cache formatted responses for a few minutes, with a per-location lock so
+# concurrent identical lookups collapse into a single upstream call
+WEATHER_CACHE_TTL = 600  # seconds
+_weather_cache: Dict[str, tuple] = {}
+_weather_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+class SttScheduler:
+    """Orders concurrent STT requests by highest response ratio (HRRN).
+
+    With several connections sharing one Whisper backend, FCFS lets a 30s
+    clip block short clips queued behind it. Whenever more than one request
+    is pending, the consumer picks the job with the highest
+    (wait_time + duration) / duration -- short clips jump the queue, but a
+    long clip's ratio grows as it waits so it can't starve. With zero or
+    one job pending this degrades to plain FCFS with no added latency.
+    """
+
+    # Rough bitrate of Opus speech uploads, for estimating clip duration
+    OPUS_BYTES_PER_SECOND = 4000
+
+    def __init__(self):
+        self._pending: List[Dict[str, Any]] = []
+        self._wakeup = asyncio.Event()
+        self._consumer: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._consumer = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._consumer:
+            self._consumer.cancel()
+
+    async def submit(self, audio_size: int, request):
+        """Queue an STT call; `request` is a no-arg coroutine factory"""
+        job = {
+            "enqueued": time.monotonic(),
+            "duration": max(audio_size / self.OPUS_BYTES_PER_SECOND, 0.1),
+            "request": request,
+            "future": asyncio.get_running_loop().create_future()
+        }
+        self._pending.append(job)
+        self._wakeup.set()
+        try:
+            return await job["future"]
+        except asyncio.CancelledError:
+            # Waiter abandoned the job (e.g. a cancelled speculative turn);
+            # drop it from the queue so the consumer never pays for it
+            if job in self._pending:
+                self._pending.remove(job)
+            raise
+
+    def _pick(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return max(
+            self._pending,
+            key=lambda j: (now - j["enqueued"] + j["duration"]) / j["duration"]
+        )
+
+    async def _run(self):
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            job = self._pick()
+            self._pending.remove(job)
+            future = job["future"]
+            if future.done():
+                # Waiter already gone; don't spend backend time on it
+                continue
+
+            # Run the request as a task tied to the future, so cancelling
+            # the waiter also aborts the in-flight Whisper call instead of
+            # head-of-line blocking live jobs behind a dead one
+            request_task = asyncio.create_task(job["request"]())
+            future.add_done_callback(
+                lambda f, t=request_task: t.cancel() if f.cancelled() else None
+            )
+            try:
+                result = await request_task
+            except asyncio.CancelledError:
+                request_task.cancel()
+                if not future.cancelled():
+                    # The scheduler itself is being stopped
+                    raise
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
 
 class VoiceAssistant:
     """Orchestrates the voice AI pipeline: STT -> LLM -> TTS"""
 
-    def __init__(self):
-        self.conversation_history: List[Dict[str, str]] = []
-        self.http_client = httpx.AsyncClient(timeout=60.0)
+    # How many recent messages to keep verbatim when compacting history
+    RECENT_WINDOW = 6
+
+    def __init__(self, http_client: httpx.AsyncClient, stt_scheduler: SttScheduler):
+        self.conversation_history: deque = deque()
+        self.history_summary: str = ""
+        self._summary_task: Optional[asyncio.Task] = None
+        self.http_client = http_client
+        self.stt_scheduler = stt_scheduler
 
     async def transcribe_audio(self, audio_data: bytes) -> Optional[str]:
         """Convert audio to text using Whisper API"""
         try:
-            files = {
-                'file': ('audio.webm', audio_data, 'audio/webm')
-            }
-            # Enable VAD for better speech segmentation
-            data = {
-                'model': 'Systran/faster-distil-whisper-small.en',
-                'response_format': 'json',
-                'vad_filter': 'true',  # Enable Voice Activity Detection
-                # VAD parameters for optimal speech detection
-                'vad_parameters': json.dumps({
-                    'threshold': 0.5,                 # Speech probability threshold
-                    'min_speech_duration_ms': 250,    # Minimum speech duration
-                    'min_silence_duration_ms': 500,   # Silence duration to split segments
-                    'speech_pad_ms': 200,             # Padding around speech segments
-                })
-            }
+            body = _STT_FORM_FIELDS + _STT_FILE_HEADER + audio_data + _STT_TRAILER
 
             logger.info("Sending audio to STT service...")
-            response = await self.http_client.post(
-                f"{STT_API_URL}/audio/transcriptions",
-                files=files,
-                data=data
+            response = await self.stt_scheduler.submit(
+                len(audio_data),
+                lambda: self.http_client.post(
+                    f"{STT_API_URL}/audio/transcriptions",
+                    content=body,
+                    headers={"content-type": _STT_CONTENT_TYPE}
+                )
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
             text = result.get('text', '').strip()
             logger.info(f"Transcribed text: {text}")
             return text
@@ -100,41 +355,54 @@ class VoiceAssistant:
             if not WEATHER_API_KEY:
                 return "Weather API key not configured. Please set WEATHER_API_KEY environment variable."
 
-            url = "http://api.openweathermap.org/data/2.5/weather"
-            params = {
-                "q": location,
-                "appid": WEATHER_API_KEY,
-                "units": "metric"  # Use Celsius
-            }
-
-            logger.info(f"Fetching weather for: {location}")
-            response = await self.http_client.get(url, params=params)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Extract relevant weather information
-            weather = {
-                "location": data["name"],
-                "country": data["sys"]["country"],
-                "temperature": data["main"]["temp"],
-                "feels_like": data["main"]["feels_like"],
-                "humidity": data["main"]["humidity"],
-                "description": data["weather"][0]["description"],
-                "wind_speed": data["wind"]["speed"]
-            }
+            cache_key = location.strip().lower()
+            cached = _weather_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < WEATHER_CACHE_TTL:
+                logger.info(f"Weather cache hit for: {location}")
+                return cached[1]
+
+            async with _weather_locks[cache_key]:
+                # Re-check: another task may have fetched while we waited
+                cached = _weather_cache.get(cache_key)
+                if cached and time.monotonic() - cached[0] < WEATHER_CACHE_TTL:
+                    return cached[1]
+
+                url = "http://api.openweathermap.org/data/2.5/weather"
+                params = {
+                    "q": location,
+                    "appid": WEATHER_API_KEY,
+                    "units": "metric"  # Use Celsius
+                }
+
+                logger.info(f"Fetching weather for: {location}")
+                response = await self.http_client.get(url, params=params)
+                response.raise_for_status()
 
-            # Format as natural text for LLM
-            weather_text = (
-                f"Current weather in {weather['location']}, {weather['country']}: "
-                f"{weather['description']}. "
-                f"Temperature: {weather['temperature']}°C (feels like {weather['feels_like']}°C). "
-                f"Humidity: {weather['humidity']}%. "
-                f"Wind speed: {weather['wind_speed']} m/s."
-            )
+                data = orjson.loads(response.content)
+
+                # Extract relevant weather information
+                weather = {
+                    "location": data["name"],
+                    "country": data["sys"]["country"],
+                    "temperature": data["main"]["temp"],
+                    "feels_like": data["main"]["feels_like"],
+                    "humidity": data["main"]["humidity"],
+                    "description": data["weather"][0]["description"],
+                    "wind_speed": data["wind"]["speed"]
+                }
+
+                # Format as natural text for LLM
+                weather_text = (
+                    f"Current weather in {weather['location']}, {weather['country']}: "
+                    f"{weather['description']}. "
+                    f"Temperature: {weather['temperature']}°C (feels like {weather['feels_like']}°C). "
+                    f"Humidity: {weather['humidity']}%. "
+                    f"Wind speed: {weather['wind_speed']} m/s."
+                )
 
-            logger.info(f"Weather data: {weather_text}")
-            return weather_text
+                _weather_cache[cache_key] = (time.monotonic(), weather_text)
+                logger.info(f"Weather data: {weather_text}")
+                return weather_text
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -154,85 +422,218 @@ class VoiceAssistant:
         else:
             return f"Unknown tool: {tool_name}"
 
-    async def chat_with_llm(self, user_message: str) -> str:
-        """Send message to LLM with tool calling support"""
+    def reset_conversation(self):
+        """Drop all conversation state, including any in-flight summary.
+
+        The summarization task must be cancelled first: left running, it
+        would complete after the reset and write a summary of the cleared
+        conversation into the new one.
+        """
+        if self._summary_task is not None:
+            self._summary_task.cancel()
+            self._summary_task = None
+        self.conversation_history.clear()
+        self.history_summary = ""
+
+    def _compact_history(self):
+        """Compact history to a sliding window plus a running summary.
+
+        Keeps the last RECENT_WINDOW messages verbatim and folds older turns
+        into `history_summary` via a background LLM call, so the prompt stays
+        a constant size no matter how long the session runs.
+        """
+        if len(self.conversation_history) <= 10:
+            return
+
+        # O(1) pops from the left instead of re-slicing the whole list
+        evicted: List[Dict[str, str]] = []
+        while len(self.conversation_history) > self.RECENT_WINDOW:
+            evicted.append(self.conversation_history.popleft())
+        # Never split a tool exchange: a tool result is only valid directly
+        # after the assistant message that requested it
+        while self.conversation_history and self.conversation_history[0]["role"] == "tool":
+            evicted.append(self.conversation_history.popleft())
+
+        self._summary_task = asyncio.create_task(self._summarize_evicted(evicted))
+
+    async def _summarize_evicted(self, evicted: List[Dict[str, str]]):
+        """Fold evicted turns (plus any prior summary) into a fresh summary"""
         try:
-            # Add user message to history
-            self.conversation_history.append({
-                "role": "user",
-                "content": user_message
-            })
+            transcript = "\n".join(
+                f"{m['role']}: {m['content']}"
+                for m in evicted if m.get("content")
+            )
+            if self.history_summary:
+                transcript = f"(earlier summary) {self.history_summary}\n{transcript}"
 
-            # Prepare the chat completion request
             payload = {
-                "model": "Qwen/Qwen2.5-7B-Instruct-GPTQ-Int4",
+                "model": LLM_MODEL,
                 "messages": [
                     {
                         "role": "system",
-                        "content": "You are a helpful voice assistant. Keep responses concise and natural for voice output. When the user asks about weather, use the get_weather tool to provide accurate current information."
+                        "content": "Summarize the following conversation in at most 80 tokens. Keep facts the assistant may need later (names, places, preferences, open questions)."
                     },
-                    *self.conversation_history
+                    {
+                        "role": "user",
+                        "content": transcript
+                    }
                 ],
-                "tools": TOOLS,
-                "tool_choice": "auto",
-                "temperature": 0.7,
-                "max_tokens": 150
+                "temperature": 0.0,
+                "max_tokens": 120
             }
 
-            logger.info("Sending request to LLM...")
             response = await self.http_client.post(
                 f"{LLM_API_URL}/chat/completions",
-                json=payload
+                content=orjson.dumps(payload),
+                headers={"content-type": "application/json"}
             )
             response.raise_for_status()
 
-            result = response.json()
-            message = result["choices"][0]["message"]
-
-            # Check if LLM wants to call a tool
-            if message.get("tool_calls"):
-                tool_call = message["tool_calls"][0]
-                function_name = tool_call["function"]["name"]
-                function_args = json.loads(tool_call["function"]["arguments"])
+            summary = orjson.loads(response.content)["choices"][0]["message"].get("content")
+            if summary:
+                self.history_summary = summary.strip()
+                logger.info(f"Updated conversation summary: {self.history_summary}")
 
-                # Execute the tool
-                tool_result = await self.execute_tool_call(function_name, function_args)
+        except Exception as e:
+            logger.error(f"History summarization error: {e}")
+
+    async def _stream_completion(self, messages: List[Dict[str, Any]],
+                                 tool_calls: List[Dict[str, Any]]) -> AsyncIterator[str]:
+        """POST a streaming chat completion and yield sentence-sized text chunks.
+
+        Parses the SSE stream line by line, buffering tokens and flushing
+        whenever a sentence boundary appears. Tool call deltas are accumulated
+        into the caller-provided `tool_calls` list.
+        """
+        buffer = ""
+        async with self.http_client.stream(
+            "POST",
+            f"{LLM_API_URL}/chat/completions",
+            content=_chat_payload_bytes(messages),
+            headers={"content-type": "application/json"}
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data.strip() == "[DONE]":
+                    break
+
+                delta = orjson.loads(data)["choices"][0]["delta"]
+
+                # Accumulate tool call fragments (id/name/arguments arrive split)
+                for tc in delta.get("tool_calls") or []:
+                    index = tc.get("index", 0)
+                    while len(tool_calls) <= index:
+                        tool_calls.append({
+                            "id": "",
+                            "type": "function",
+                            "function": {"name": "", "arguments": ""}
+                        })
+                    entry = tool_calls[index]
+                    if tc.get("id"):
+                        entry["id"] = tc["id"]
+                    function = tc.get("function") or {}
+                    if function.get("name"):
+                        entry["function"]["name"] += function["name"]
+                    if function.get("arguments"):
+                        entry["function"]["arguments"] += function["arguments"]
+
+                token = delta.get("content")
+                if not token:
+                    continue
+                buffer += token
+
+                # Flush complete sentences, keep the partial tail buffered
+                *sentences, buffer = SENTENCE_BOUNDARY.split(buffer)
+                for sentence in sentences:
+                    if sentence.strip():
+                        yield sentence.strip()
+
+        if buffer.strip():
+            yield buffer.strip()
+
+    async def chat_with_llm(self, user_message: str) -> AsyncIterator[str]:
+        """Stream the LLM response as sentences, with tool calling support.
+
+        Sentences are yielded as soon as they are complete so TTS can start
+        before the full completion has finished generating.
+        """
+        try:
+            # Add user message to history
+            self.conversation_history.append({
+                "role": "user",
+                "content": user_message
+            })
 
-                # Add tool call to history
-                self.conversation_history.append({
+            # Prepare the chat completion request: static prefix first, then
+            # the (rarely changing) summary, then history
+            messages: List[Dict[str, Any]] = [
+                {
+                    "role": "system",
+                    "content": TOOLS_SYSTEM_MSG
+                },
+                {
+                    "role": "system",
+                    "content": SYSTEM_MSG
+                }
+            ]
+            if self.history_summary:
+                messages.append({
+                    "role": "system",
+                    "content": f"Summary of the conversation so far: {self.history_summary}"
+                })
+            messages.extend(self.conversation_history)
+
+            logger.info("Streaming request to LLM...")
+            sentences: List[str] = []
+            tool_calls: List[Dict[str, Any]] = []
+            async for sentence in self._stream_completion(messages, tool_calls):
+                sentences.append(sentence)
+                yield sentence
+
+            # Check if LLM wants to call tools
+            if tool_calls:
+                # Execute every requested tool concurrently; N parallel tool
+                # calls cost one round-trip instead of N sequential ones
+                tool_results = await asyncio.gather(*[
+                    self.execute_tool_call(
+                        tc["function"]["name"],
+                        orjson.loads(tc["function"]["arguments"])
+                    )
+                    for tc in tool_calls
+                ])
+
+                # Record the tool exchange in history
+                tool_turns: List[Dict[str, Any]] = [{
                     "role": "assistant",
                     "content": None,
-                    "tool_calls": message["tool_calls"]
-                })
-
-                # Add tool result to history
-                self.conversation_history.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call["id"],
-                    "name": function_name,
-                    "content": tool_result
-                })
+                    "tool_calls": tool_calls
+                }]
+                for tool_call, tool_result in zip(tool_calls, tool_results):
+                    tool_turns.append({
+                        "role": "tool",
+                        "tool_call_id": tool_call["id"],
+                        "name": tool_call["function"]["name"],
+                        "content": tool_result
+                    })
+                self.conversation_history.extend(tool_turns)
 
-                # Make another LLM call with tool result
-                payload["messages"] = [
-                    {
-                        "role": "system",
-                        "content": "You are a helpful voice assistant. Keep responses concise and natural for voice output."
-                    },
-                    *self.conversation_history
-                ]
+                # Follow-up call: append to the existing messages in place so
+                # the prompt prefix stays identical and the KV cache hits
+                messages.extend(tool_turns)
 
-                logger.info("Sending follow-up request to LLM with tool result...")
-                response = await self.http_client.post(
-                    f"{LLM_API_URL}/chat/completions",
-                    json=payload
-                )
-                response.raise_for_status()
-                result = response.json()
-                message = result["choices"][0]["message"]
+                logger.info("Streaming follow-up request to LLM with tool result...")
+                async for sentence in self._stream_completion(messages, []):
+                    sentences.append(sentence)
+                    yield sentence
 
             # Get final assistant response
-            assistant_message = message.get("content", "I'm not sure how to respond to that.")
+            if not sentences:
+                sentences.append(FALLBACK_NO_RESPONSE)
+                yield FALLBACK_NO_RESPONSE
+            assistant_message = " ".join(sentences)
 
             # Add assistant response to history
             self.conversation_history.append({
@@ -240,36 +641,51 @@ class VoiceAssistant:
                 "content": assistant_message
             })
 
-            # Keep conversation history manageable (last 10 messages)
-            if len(self.conversation_history) > 10:
-                self.conversation_history = self.conversation_history[-10:]
+            # Keep the prompt bounded: window + background summarization
+            self._compact_history()
 
             logger.info(f"LLM response: {assistant_message}")
-            return assistant_message
 
         except Exception as e:
             logger.error(f"LLM error: {e}")
-            return "I'm having trouble processing your request. Please try again."
+            yield FALLBACK_LLM_ERROR
 
     async def text_to_speech(self, text: str) -> Optional[bytes]:
         """Convert text to speech using Kokoro TTS"""
         try:
+            cache_key = _tts_cache_key(text)
+            cached = _tts_cache.get(cache_key)
+            if cached is not None:
+                _tts_cache.move_to_end(cache_key)
+                logger.info(f"TTS cache hit: {text[:50]}...")
+                return cached
+
             payload = {
                 "model": "kokoro",
                 "input": text,
-                "voice": "af_sky",  # Female voice (options: af_sky, af_bella, af_nicole, am_adam, am_michael)
+                "voice": TTS_VOICE,
                 "response_format": "mp3",
-                "speed": 1.0
+                "speed": TTS_SPEED
             }
 
             logger.info(f"Converting to speech: {text[:50]}...")
-            response = await self.http_client.post(
+            chunks: List[bytes] = []
+            async with self.http_client.stream(
+                "POST",
                 TTS_API_URL,
-                json=payload
-            )
-            response.raise_for_status()
+                content=orjson.dumps(payload),
+                headers={"content-type": "application/json"}
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+
+            audio_data = b"".join(chunks)
+
+            _tts_cache[cache_key] = audio_data
+            if len(_tts_cache) > _TTS_CACHE_MAX:
+                _tts_cache.popitem(last=False)
 
-            audio_data = response.content
             logger.info(f"Generated {len(audio_data)} bytes of audio")
             return audio_data
 
@@ -277,30 +693,115 @@ class VoiceAssistant:
             logger.error(f"TTS error: {e}")
             return None
 
-    async def process_voice_input(self, audio_data: bytes) -> Optional[bytes]:
-        """Complete pipeline: STT -> LLM -> TTS"""
-        try:
-            # Step 1: Transcribe audio to text
-            text = await self.transcribe_audio(audio_data)
-            if not text:
-                logger.warning("No text transcribed from audio")
-                return None
-
-            # Step 2: Get LLM response (with potential tool calls)
-            response_text = await self.chat_with_llm(text)
-
-            # Step 3: Convert response to speech
-            audio_response = await self.text_to_speech(response_text)
+    async def synthesize_response(self, text: str) -> AsyncIterator[bytes]:
+        """Streaming LLM -> concurrent TTS for an already-transcribed turn.
 
-            return audio_response
+        TTS synthesis is dispatched per sentence as the LLM stream produces
+        them, and MP3 chunks are yielded in sentence order as soon as each is
+        ready -- the client can start playback before the full response exists.
+        """
+        try:
+            # Stream LLM sentences, synthesizing each concurrently.
+            # The queue preserves sentence order while TTS calls overlap.
+            tts_queue: asyncio.Queue = asyncio.Queue()
+
+            async def dispatch_tts():
+                try:
+                    async for sentence in self.chat_with_llm(text):
+                        await tts_queue.put(
+                            asyncio.create_task(self.text_to_speech(sentence))
+                        )
+                finally:
+                    await tts_queue.put(None)
+
+            producer = asyncio.create_task(dispatch_tts())
+            try:
+                while True:
+                    task = await tts_queue.get()
+                    if task is None:
+                        break
+                    audio_chunk = await task
+                    if audio_chunk:
+                        yield audio_chunk
+                await producer
+            finally:
+                if not producer.done():
+                    producer.cancel()
 
         except Exception as e:
             logger.error(f"Pipeline error: {e}")
-            return None
 
-    async def cleanup(self):
-        """Clean up resources"""
-        await self.http_client.aclose()
+
+class SpeculativeTurn:
+    """Speculative STT->LLM kickoff for a turn that is still being recorded.
+
+    The STT backend is one-shot (no partial hypotheses), so speculation is
+    driven by the client's VAD: when it reports a speech pause the utterance
+    is plausibly complete, and we transcribe the audio received so far --
+    the frames still arriving are the silence tail the VAD waits out before
+    stopping -- then optimistically run the LLM+TTS pipeline on that
+    transcript, buffering its output. If the final transcript matches, the
+    buffered chunks are flushed and the pipeline continues live: the LLM ran
+    while final STT was still in flight. On divergence (the user resumed
+    speaking) the pipeline is cancelled and history rolled back.
+    """
+
+    def __init__(self, assistant: VoiceAssistant, audio_blob: bytes, audio_bytes: int):
+        self.assistant = assistant
+        self.audio_bytes = audio_bytes
+        self.transcript: Optional[str] = None
+        self._transcribed = asyncio.Event()
+        self._chunks: asyncio.Queue = asyncio.Queue()
+        self._history_snapshot = list(assistant.conversation_history)
+        self._task = asyncio.create_task(self._run(audio_blob))
+
+    async def _run(self, audio_blob: bytes):
+        try:
+            self.transcript = await self.assistant.transcribe_audio(audio_blob)
+        finally:
+            self._transcribed.set()
+        if not self.transcript:
+            await self._chunks.put(None)
+            return
+        logger.info(f"Speculative transcript: {self.transcript}")
+        try:
+            async for chunk in self.assistant.synthesize_response(self.transcript):
+                await self._chunks.put(chunk)
+        finally:
+            await self._chunks.put(None)
+
+    async def matches(self, final_text: Optional[str]) -> bool:
+        """Whether the speculative transcript agrees with the final one"""
+        if not final_text:
+            return False
+        try:
+            await asyncio.wait_for(self._transcribed.wait(), timeout=10.0)
+        except asyncio.TimeoutError:
+            return False
+        if not self.transcript:
+            return False
+        return " ".join(self.transcript.split()).lower() == \
+            " ".join(final_text.split()).lower()
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        """Yield buffered, then live, MP3 chunks once speculation is confirmed"""
+        while True:
+            chunk = await self._chunks.get()
+            if chunk is None:
+                break
+            yield chunk
+        await self._task
+
+    async def cancel(self):
+        """Abort the pipeline and restore history to the pre-turn snapshot"""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Speculative turn error: {e}")
+        self.assistant.conversation_history = deque(self._history_snapshot)
 
 
 @app.websocket("/ws")
@@ -309,8 +810,16 @@ async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
     logger.info("WebSocket connection established")
 
-    assistant = VoiceAssistant()
-    audio_buffer = bytearray()
+    assistant = VoiceAssistant(
+        websocket.app.state.http_client,
+        websocket.app.state.stt_scheduler
+    )
+    # Collect frames as-is and join once at audio_end: one exact-size
+    # concatenation instead of geometric bytearray reallocations
+    audio_chunks: List[bytes] = []
+    audio_bytes = 0
+    last_audio_end = 0.0
+    spec_turn: Optional[SpeculativeTurn] = None
 
     try:
         while True:
@@ -319,42 +828,98 @@ async def websocket_endpoint(websocket: WebSocket):
 
             if "bytes" in data:
                 # Accumulate audio data
-                audio_buffer.extend(data["bytes"])
-                logger.info(f"Received audio chunk: {len(data['bytes'])} bytes (total: {len(audio_buffer)})")
+                audio_chunks.append(data["bytes"])
+                audio_bytes += len(data["bytes"])
+                logger.info(f"Received audio chunk: {len(data['bytes'])} bytes (total: {audio_bytes})")
+
+                # Reject oversized uploads early instead of buffering them
+                if audio_bytes > MAX_AUDIO_BYTES:
+                    logger.warning(f"Audio buffer exceeded {MAX_AUDIO_BYTES} bytes; closing connection")
+                    await websocket.send_json({
+                        "type": "error",
+                        "message": "Audio too long"
+                    })
+                    await websocket.close()
+                    break
 
             elif "text" in data:
-                message = json.loads(data["text"])
+                message = orjson.loads(data["text"])
 
                 if message.get("type") == "audio_end":
+                    # Rate-limit processing requests per connection
+                    now = time.monotonic()
+                    if now - last_audio_end < MIN_AUDIO_END_INTERVAL:
+                        logger.warning("audio_end rate limit hit; dropping buffered audio")
+                        audio_chunks.clear()
+                        audio_bytes = 0
+                        if spec_turn is not None:
+                            await spec_turn.cancel()
+                            spec_turn = None
+                        await websocket.send_json({
+                            "type": "error",
+                            "message": "Too many requests"
+                        })
+                        continue
+                    last_audio_end = now
+
                     # Client finished sending audio
-                    logger.info(f"Processing complete audio: {len(audio_buffer)} bytes")
+                    logger.info(f"Processing complete audio: {audio_bytes} bytes")
 
-                    if len(audio_buffer) > 0:
+                    if audio_bytes > 0:
                         # Send status update
                         await websocket.send_json({
                             "type": "status",
                             "status": "processing"
                         })
 
-                        # Process the complete audio
-                        audio_response = await assistant.process_voice_input(bytes(audio_buffer))
-
-                        # Clear buffer
-                        audio_buffer.clear()
-
-                        if audio_response:
-                            # Send audio response back to client
-                            logger.info(f"Sending audio response to client: {len(audio_response)} bytes")
-                            try:
-                                await websocket.send_json({
-                                    "type": "audio_response",
-                                    "audio": base64.b64encode(audio_response).decode('utf-8'),
-                                    "format": "mp3"
-                                })
-                                logger.info("Audio response sent successfully")
-                            except Exception as e:
-                                logger.error(f"Failed to send audio response: {e}")
-                        else:
+                        # Join and clear buffer
+                        audio_blob = b"".join(audio_chunks)
+                        audio_chunks.clear()
+                        audio_bytes = 0
+
+                        # Process the audio, forwarding MP3 chunks as they
+                        # are synthesized (client concatenates playback)
+                        chunks_sent = 0
+                        try:
+                            if spec_turn is not None and spec_turn.audio_bytes == len(audio_blob):
+                                # Nothing arrived after the speculative
+                                # snapshot, so its transcript is already the
+                                # final one - skip the second STT pass
+                                logger.info("Speculative snapshot covers the full audio; skipping final STT")
+                                audio_stream = spec_turn.stream()
+                            else:
+                                final_text = await assistant.transcribe_audio(audio_blob)
+                                if spec_turn is not None and await spec_turn.matches(final_text):
+                                    # Speculation confirmed: the LLM has been
+                                    # running since before final STT finished
+                                    logger.info("Speculative transcript confirmed; reusing pipeline")
+                                    audio_stream = spec_turn.stream()
+                                else:
+                                    if spec_turn is not None:
+                                        await spec_turn.cancel()
+                                    if final_text:
+                                        audio_stream = assistant.synthesize_response(final_text)
+                                    else:
+                                        logger.warning("No text transcribed from audio")
+                                        audio_stream = None
+                            spec_turn = None
+
+                            if audio_stream is not None:
+                                async for audio_chunk in audio_stream:
+                                    logger.info(f"Sending audio chunk to client: {len(audio_chunk)} bytes")
+                                    # Announce the chunk, then send the MP3 bytes
+                                    # as a raw binary frame - no base64 inflation
+                                    await websocket.send_json({
+                                        "type": "audio_response_begin",
+                                        "format": "mp3",
+                                        "bytes": len(audio_chunk)
+                                    })
+                                    await websocket.send_bytes(audio_chunk)
+                                    chunks_sent += 1
+                        except Exception as e:
+                            logger.error(f"Failed to send audio response: {e}")
+
+                        if chunks_sent == 0:
                             logger.warning("No audio response generated")
                             await websocket.send_json({
                                 "type": "error",
@@ -369,10 +934,33 @@ async def websocket_endpoint(websocket: WebSocket):
                         })
                         logger.info("Ready status sent")
 
+                elif message.get("type") == "speech_pause":
+                    # The client's VAD heard silence: the utterance is
+                    # plausibly complete, so speculate once on the buffered
+                    # audio. A later pause replaces the speculation -- it
+                    # means the user resumed speaking since the snapshot.
+                    if audio_bytes >= SPECULATIVE_STT_MIN_BYTES:
+                        if spec_turn is not None:
+                            await spec_turn.cancel()
+                        spec_turn = SpeculativeTurn(assistant, b"".join(audio_chunks), audio_bytes)
+
+                elif message.get("type") == "audio_discard":
+                    # Client decided the recording was too short to process
+                    logger.info("Discarding buffered audio at client request")
+                    audio_chunks.clear()
+                    audio_bytes = 0
+                    if spec_turn is not None:
+                        await spec_turn.cancel()
+                        spec_turn = None
+
                 elif message.get("type") == "reset":
                     # Reset conversation
-                    assistant.conversation_history.clear()
-                    audio_buffer.clear()
+                    if spec_turn is not None:
+                        await spec_turn.cancel()
+                        spec_turn = None
+                    assistant.reset_conversation()
+                    audio_chunks.clear()
+                    audio_bytes = 0
                     await websocket.send_json({
                         "type": "status",
                         "status": "reset_complete"
@@ -384,7 +972,8 @@ async def websocket_endpoint(websocket: WebSocket):
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
     finally:
-        await assistant.cleanup()
+        if spec_turn is not None:
+            await spec_turn.cancel()
 
 
 @app.get("/health")
@@ -395,4 +984,13 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # uvloop + httptools: C-accelerated event loop and HTTP parsing, which
+    # matters for the high-frequency small frames on the audio WebSocket
+    uvicorn.run(
+        "backend:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        ws="websockets"
+    )
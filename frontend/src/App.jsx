@@ -18,6 +18,9 @@ function App() {
   const speechTimeoutRef = useRef(null)
   const isSpeakingRef = useRef(false)
   const audioStreamRef = useRef(null)
+  const audioQueueRef = useRef([])
+  const isPlayingAudioRef = useRef(false)
+  const pauseHintSentRef = useRef(false)
 
   // VAD Configuration
   const VAD_CONFIG = {
@@ -60,16 +63,23 @@ function App() {
         setError('')
       }
 
+      ws.binaryType = 'arraybuffer'
+
       ws.onmessage = (event) => {
+        // Binary frames carry raw MP3 chunks announced by audio_response_begin
+        if (event.data instanceof ArrayBuffer) {
+          enqueueAudioChunk(event.data)
+          return
+        }
+
         try {
           const data = JSON.parse(event.data)
           console.log('Received:', data)
 
           if (data.type === 'status') {
             setStatus(data.status)
-          } else if (data.type === 'audio_response') {
+          } else if (data.type === 'audio_response_begin') {
             setStatus('speaking')
-            playAudioResponse(data.audio)
           } else if (data.type === 'error') {
             setError(data.message)
             setStatus('ready')
@@ -137,8 +147,23 @@ function App() {
       }
     }
 
+    // Speech paused - hint the server that the utterance is plausibly
+    // complete so it can start transcribing speculatively while the VAD
+    // waits out the silence window
+    if (!isSpeakingNow && isSpeakingRef.current && !pauseHintSentRef.current) {
+      if (
+        wsRef.current && wsRef.current.readyState === WebSocket.OPEN &&
+        mediaRecorderRef.current && mediaRecorderRef.current.state === 'recording'
+      ) {
+        wsRef.current.send(JSON.stringify({ type: 'speech_pause' }))
+      }
+      pauseHintSentRef.current = true
+    }
+
     // Speech continuing
     if (isSpeakingNow && isSpeakingRef.current) {
+      pauseHintSentRef.current = false
+
       // Reset silence timeout
       if (speechTimeoutRef.current) {
         clearTimeout(speechTimeoutRef.current)
@@ -234,39 +259,44 @@ function App() {
 
       const stream = audioStreamRef.current
 
+      // Prefer bare Opus in an ogg container - smaller frames per second of
+      // speech than webm, so less buffering and a faster upload to STT
+      const mimeType = ['audio/ogg;codecs=opus', 'audio/webm;codecs=opus', 'audio/webm']
+        .find((type) => MediaRecorder.isTypeSupported(type))
+
       // Setup media recorder
-      const mediaRecorder = new MediaRecorder(stream, {
-        mimeType: 'audio/webm',
-      })
+      const mediaRecorder = new MediaRecorder(stream, { mimeType })
 
       audioChunksRef.current = []
 
       mediaRecorder.ondataavailable = (event) => {
         if (event.data.size > 0) {
           audioChunksRef.current.push(event.data)
+          // Stream each chunk as it is captured so the server can start
+          // transcribing speculatively before the recording ends
+          if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
+            wsRef.current.send(event.data)
+          }
         }
       }
 
       mediaRecorder.onstop = async () => {
-        const audioBlob = new Blob(audioChunksRef.current, { type: 'audio/webm' })
+        const audioBlob = new Blob(audioChunksRef.current, { type: mimeType })
         console.log('Audio blob size:', audioBlob.size)
 
-        // Only send if we have meaningful audio
-        if (audioBlob.size > 1000) {
-          if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
+        if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
+          // Only process if we have meaningful audio
+          if (audioBlob.size > 1000) {
             setTranscript('Processing...')
 
-            // Send the audio blob
-            const arrayBuffer = await audioBlob.arrayBuffer()
-            wsRef.current.send(arrayBuffer)
-
-            // Signal end of audio
+            // Signal end of audio (chunks were already streamed)
             wsRef.current.send(JSON.stringify({ type: 'audio_end' }))
-          }
-        } else {
-          console.log('Audio too short, ignoring')
-          if (vadActive) {
-            setTranscript('Listening... Speak to start')
+          } else {
+            console.log('Audio too short, discarding')
+            wsRef.current.send(JSON.stringify({ type: 'audio_discard' }))
+            if (vadActive) {
+              setTranscript('Listening... Speak to start')
+            }
           }
         }
 
@@ -289,50 +319,62 @@ function App() {
     }
   }
 
-  const playAudioResponse = async (base64Audio) => {
+  const enqueueAudioChunk = (arrayBuffer) => {
     try {
-      console.log('Decoding audio response, length:', base64Audio.length)
-
-      const binaryString = atob(base64Audio)
-      const bytes = new Uint8Array(binaryString.length)
-      for (let i = 0; i < binaryString.length; i++) {
-        bytes[i] = binaryString.charCodeAt(i)
-      }
-      const blob = new Blob([bytes], { type: 'audio/mpeg' })
-      const url = URL.createObjectURL(blob)
-
-      const audio = new Audio(url)
-
-      audio.onended = () => {
-        console.log('Audio playback ended')
-        setStatus(vadActive ? 'listening' : 'ready')
-        setTranscript(vadActive ? 'Listening... Speak to start' : '')
-        URL.revokeObjectURL(url)
-      }
+      console.log('Queueing audio chunk, bytes:', arrayBuffer.byteLength)
 
-      audio.onerror = (e) => {
-        console.error('Audio playback error:', e, audio.error)
-        setError(`Failed to play audio: ${audio.error?.message || 'Unknown error'}`)
-        setStatus(vadActive ? 'listening' : 'ready')
-        URL.revokeObjectURL(url)
-      }
+      audioQueueRef.current.push(new Blob([arrayBuffer], { type: 'audio/mpeg' }))
 
-      try {
-        await audio.play()
-        console.log('Audio play() succeeded')
-      } catch (playError) {
-        console.error('Play was prevented:', playError)
-        setError(`Autoplay blocked: ${playError.message}`)
-        setStatus(vadActive ? 'listening' : 'ready')
-        URL.revokeObjectURL(url)
+      // Kick off playback if nothing is currently playing
+      if (!isPlayingAudioRef.current) {
+        playNextAudioChunk()
       }
     } catch (e) {
-      console.error('Error in playAudioResponse:', e)
+      console.error('Error in enqueueAudioChunk:', e)
       setError(`Failed to process audio: ${e.message}`)
       setStatus(vadActive ? 'listening' : 'ready')
     }
   }
 
+  const playNextAudioChunk = async () => {
+    const blob = audioQueueRef.current.shift()
+
+    if (!blob) {
+      // Queue drained - streaming response finished playing
+      console.log('Audio playback ended')
+      isPlayingAudioRef.current = false
+      setStatus(vadActive ? 'listening' : 'ready')
+      setTranscript(vadActive ? 'Listening... Speak to start' : '')
+      return
+    }
+
+    isPlayingAudioRef.current = true
+    const url = URL.createObjectURL(blob)
+    const audio = new Audio(url)
+
+    audio.onended = () => {
+      URL.revokeObjectURL(url)
+      playNextAudioChunk()
+    }
+
+    audio.onerror = (e) => {
+      console.error('Audio playback error:', e, audio.error)
+      setError(`Failed to play audio: ${audio.error?.message || 'Unknown error'}`)
+      URL.revokeObjectURL(url)
+      playNextAudioChunk()
+    }
+
+    try {
+      await audio.play()
+      console.log('Audio play() succeeded')
+    } catch (playError) {
+      console.error('Play was prevented:', playError)
+      setError(`Autoplay blocked: ${playError.message}`)
+      URL.revokeObjectURL(url)
+      playNextAudioChunk()
+    }
+  }
+
   const visualize = () => {
     const canvas = document.getElementById('visualizer')
     if (!canvas || !analyserRef.current) return